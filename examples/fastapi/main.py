@@ -3,24 +3,17 @@
 import importlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from os import getenv
 from pathlib import Path
 
 from mcp.server import MCPServer
 from mcp.types import TextContent
-from pydantic_settings import BaseSettings
 
 from gdansk import Ship, Vite
 
 FastAPI = importlib.import_module("fastapi").FastAPI
 
-
-class Settings(BaseSettings):
-    """Runtime settings for this example."""
-
-    production: bool = False
-
-
-SETTINGS = Settings()
+PRODUCTION = getenv("PRODUCTION", "").lower() in ("1", "true", "yes")
 
 ship = Ship(vite=Vite(Path(__file__).parent / "src/mount/views"))
 
@@ -28,12 +21,12 @@ ship = Ship(vite=Vite(Path(__file__).parent / "src/mount/views"))
 @ship.widget(name="hello", path=Path("hello/widget.tsx"))
 def hello(name: str = "world") -> list[TextContent]:
     """Return a greeting message."""
-    return [TextContent(type="text", text=f"Hello, {name}!")]
+    return [TextContent.model_construct(type="text", text=f"Hello, {name}!")]
 
 
 @asynccontextmanager
 async def mcp_lifespan(mcp: MCPServer) -> AsyncIterator[None]:
-    async with ship.lifespan(mcp=mcp, watch=not SETTINGS.production):
+    async with ship.lifespan(mcp=mcp, watch=not PRODUCTION):
         yield
 
 
@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import Any, cast
 
 import pytest
-from starlette.testclient import TestClient
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
 
@@ -26,6 +25,21 @@ def test_hello_returns_default_text():
     assert content[0].text == "Hello, world!"
 
 
+def test_hello_formats_custom_name():
+    content = fastapi_main.hello("gdansk")
+    assert content[0].text == "Hello, gdansk!"
+
+
+def test_hello_default_result_is_not_shared():
+    first = fastapi_main.hello()
+    first[0].text = "changed"
+    first.clear()
+
+    content = fastapi_main.hello()
+    assert len(content) == 1
+    assert content[0].text == "Hello, world!"
+
+
 async def test_mcp_call_tool_returns_structured_hello():
     spec = fastapi_main.ship._widget_manager[Path("hello/widget.tsx")]
     fastapi_main.mcp._tool_manager._tools.setdefault(spec.tool.name, spec.tool)
@@ -34,7 +48,12 @@ async def test_mcp_call_tool_returns_structured_hello():
 
 
 @pytest.fixture(scope="module")
-def test_client():
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="module")
+async def lifespan():
     monkeypatch = pytest.MonkeyPatch()
 
     async def prepare_frontend(*, watch: bool | None) -> None:
@@ -43,23 +62,53 @@ def test_client():
     monkeypatch.setattr(fastapi_main.ship, "_prepare_frontend", prepare_frontend)
 
     try:
-        with TestClient(fastapi_main.app, base_url="http://127.0.0.1:8000") as client:
-            yield client
+        async with fastapi_main.app.router.lifespan_context(fastapi_main.app):
+            yield
     finally:
         monkeypatch.undo()
 
 
-def test_mcp_mount_redirects_to_trailing_slash(test_client):
-    response = test_client.get("/mcp", follow_redirects=False)
-    assert response.status_code == 307
-    assert response.headers["location"].endswith("/mcp/")
+async def _asgi_get(path: str) -> dict[str, Any]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"127.0.0.1:8000"), (b"accept", b"*/*")],
+        "server": ("127.0.0.1", 8000),
+        "client": ("127.0.0.1", 50000),
+    }
+    messages: list[dict[str, Any]] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await fastapi_main.app(scope, receive, send)
+    return messages[0]
+
+
+@pytest.mark.usefixtures("lifespan")
+async def test_mcp_mount_redirects_to_trailing_slash():
+    start = await _asgi_get("/mcp")
+    assert start["status"] == 307
+    assert dict(start["headers"])[b"location"].endswith(b"/mcp/")
 
 
-def test_mcp_mount_endpoint_is_active(test_client):
-    response = test_client.get("/mcp/", follow_redirects=False)
-    assert response.status_code == 400
+@pytest.mark.usefixtures("lifespan")
+async def test_mcp_mount_endpoint_is_active():
+    start = await _asgi_get("/mcp/")
+    assert start["status"] == 400
 
 
-def test_mcp_does_not_have_double_prefix(test_client):
-    response = test_client.get("/mcp/mcp", follow_redirects=False)
-    assert response.status_code == 404
+@pytest.mark.usefixtures("lifespan")
+async def test_mcp_does_not_have_double_prefix():
+    start = await _asgi_get("/mcp/mcp")
+    assert start["status"] == 404
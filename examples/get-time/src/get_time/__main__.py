@@ -2,13 +2,14 @@
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime
 from pathlib import Path
+from time import gmtime, time_ns
+from typing import Final
 
 import uvicorn
 from mcp.server import MCPServer
 from mcp.types import TextContent
-from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from gdansk import Ship, Vite
 
@@ -18,8 +19,13 @@ ship = Ship(vite=Vite(Path(__file__).parent / "views"))
 @ship.widget(name="get-time", path=Path("get-time/widget.tsx"))
 def get_time() -> list[TextContent]:
     """Get the current server time in ISO 8601 format."""
-    time_str = datetime.now(tz=UTC).isoformat()
-    return [TextContent(type="text", text=time_str)]
+    seconds, nanoseconds = divmod(time_ns(), 1_000_000_000)
+    now = gmtime(seconds)
+    time_str = (
+        f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+        f"T{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}.{nanoseconds // 1000:06d}+00:00"
+    )
+    return [TextContent.model_construct(type="text", text=time_str)]
 
 
 @asynccontextmanager
@@ -31,17 +37,49 @@ async def lifespan(mcp: MCPServer) -> AsyncIterator[None]:  # noqa: D103
 mcp = MCPServer(name="Get Time Server", lifespan=lifespan)
 
 
+_CORS_HEADERS: Final[tuple[tuple[bytes, bytes], ...]] = (
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"*"),
+)
+_PREFLIGHT_HEADERS: Final[tuple[tuple[bytes, bytes], ...]] = (*_CORS_HEADERS, (b"access-control-max-age", b"600"))
+
+
+class FastCORS:
+    """Permissive CORS middleware that answers preflight requests without entering the wrapped app."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer preflight requests directly and append CORS headers to every other response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if b"access-control-request-method" in request_headers:
+                # Echo the requested headers: browsers never let a "*" wildcard cover Authorization.
+                allow_headers = request_headers.get(b"access-control-request-headers", b"*")
+                headers = [*_PREFLIGHT_HEADERS, (b"access-control-allow-headers", allow_headers)]
+                await send({"type": "http.response.start", "status": 204, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_CORS_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
 def main() -> None:
     """Run the development server for the get-time example."""
     app = mcp.streamable_http_app()
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
     app.mount(path=ship.assets_path, app=ship.assets)
-    uvicorn.run(app, port=3001)
+    uvicorn.run(FastCORS(app), port=3001, access_log=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+import get_time.__main__ as get_time_main
+
+
+def test_get_time_returns_current_utc_isoformat():
+    parsed = datetime.fromisoformat(get_time_main.get_time()[0].text)
+
+    assert parsed.tzinfo is not None
+    assert parsed.utcoffset() == timedelta(0)
+    assert abs(datetime.now(UTC) - parsed) < timedelta(seconds=5)
+
+
+async def test_fast_cors_answers_preflight():
+    sent: list[dict[str, Any]] = []
+
+    async def app(_scope, _receive, _send):
+        raise AssertionError
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(b"access-control-request-method", b"POST"), (b"access-control-request-headers", b"authorization")]
+    await get_time_main.FastCORS(app)({"type": "http", "method": "OPTIONS", "headers": headers}, receive, send)
+
+    assert sent[0]["status"] == 204
+    assert (b"access-control-allow-headers", b"authorization") in sent[0]["headers"]
@@ -3,11 +3,12 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Final
 
 import uvicorn
 from mcp.server import MCPServer
 from mcp.types import TextContent
-from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from gdansk import Ship, Vite
 
@@ -29,17 +30,52 @@ async def lifespan(mcp: MCPServer) -> AsyncIterator[None]:  # noqa: D103
 mcp = MCPServer(name="Production Example Server", lifespan=lifespan)
 
 
+_CORS_HEADERS: Final[tuple[tuple[bytes, bytes], ...]] = (
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"*"),
+)
+_PREFLIGHT_HEADERS: Final[tuple[tuple[bytes, bytes], ...]] = (*_CORS_HEADERS, (b"access-control-max-age", b"600"))
+
+
+class FastCORS:
+    """Permissive CORS middleware that answers preflight requests without entering the wrapped app."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer preflight requests directly and append CORS headers to every other response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if b"access-control-request-method" in request_headers:
+                # Echo the requested headers: browsers never let a "*" wildcard cover Authorization.
+                allow_headers = request_headers.get(b"access-control-request-headers", b"*")
+                headers = [*_PREFLIGHT_HEADERS, (b"access-control-allow-headers", allow_headers)]
+                await send({"type": "http.response.start", "status": 204, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_CORS_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+starlette_app = mcp.streamable_http_app()
+starlette_app.mount(path=ship.assets_path, app=ship.assets)
+app = FastCORS(starlette_app)
+
+
 def main() -> None:
     """Run the production example server."""
-    app = mcp.streamable_http_app()
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    app.mount(path=ship.assets_path, app=ship.assets)
-    uvicorn.run(app, port=3001)
+    uvicorn.run(app, port=3001, access_log=False)
 
 
 if __name__ == "__main__":
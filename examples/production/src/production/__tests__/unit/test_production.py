@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+import production.__main__ as production_main
+
+
+async def test_fast_cors_answers_preflight():
+    sent: list[dict[str, Any]] = []
+
+    async def app(_scope, _receive, _send):
+        raise AssertionError
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(b"access-control-request-method", b"POST"), (b"access-control-request-headers", b"authorization")]
+    await production_main.FastCORS(app)({"type": "http", "method": "OPTIONS", "headers": headers}, receive, send)
+
+    assert sent[0]["status"] == 204
+    assert (b"access-control-allow-headers", b"authorization") in sent[0]["headers"]
@@ -4,11 +4,13 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from uuid import uuid4
+from secrets import token_hex
+from typing import Final
 
 import uvicorn
 from mcp.server import MCPServer
-from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from gdansk import Ship, Vite
 
@@ -25,20 +27,19 @@ class Todo:
     completed: bool = False
 
 
-TODOS: list[Todo] = []
+TODOS: dict[str, Todo] = {}
 
 
 def _serialize_todos() -> list[Todo]:
-    return list(TODOS)
+    return list(TODOS.values())
 
 
 def _get_todo(todo_id: str) -> Todo:
-    for todo in TODOS:
-        if todo.id == todo_id:
-            return todo
-
-    msg = f"Todo {todo_id!r} not found."
-    raise ValueError(msg)
+    try:
+        return TODOS[todo_id]
+    except KeyError:
+        msg = f"Todo {todo_id!r} not found."
+        raise ValueError(msg) from None
 
 
 @ship.widget(path=Path("todo/widget.tsx"), name="list-todos", structured_output=True)
@@ -59,12 +60,12 @@ mcp = MCPServer(name="Todo Server", lifespan=lifespan)
 @mcp.tool(name="add-todo", structured_output=True)
 def add_todo(title: str) -> list[Todo]:
     """Add a todo and return the updated list."""
-    cleaned_title = title.strip()
-    if not cleaned_title:
+    if not title or title.isspace():
         msg = "Title cannot be empty."
         raise ValueError(msg)
 
-    TODOS.append(Todo(id=uuid4().hex, title=cleaned_title))
+    todo = Todo(id=token_hex(16), title=title.strip())
+    TODOS[todo.id] = todo
     return _serialize_todos()
 
 
@@ -79,22 +80,55 @@ def toggle_todo(todo_id: str) -> list[Todo]:
 @mcp.tool(name="delete-todo", structured_output=True)
 def delete_todo(todo_id: str) -> list[Todo]:
     """Delete a todo and return the updated list."""
-    todo = _get_todo(todo_id)
-    TODOS.remove(todo)
+    _get_todo(todo_id)
+    del TODOS[todo_id]
     return _serialize_todos()
 
 
+_CORS_HEADERS: Final[tuple[tuple[bytes, bytes], ...]] = (
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"*"),
+)
+_PREFLIGHT_HEADERS: Final[tuple[tuple[bytes, bytes], ...]] = (*_CORS_HEADERS, (b"access-control-max-age", b"600"))
+
+
+class FastCORS:
+    """Permissive CORS middleware that answers preflight requests without entering the wrapped app."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer preflight requests directly and append CORS headers to every other response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if b"access-control-request-method" in request_headers:
+                # Echo the requested headers: browsers never let a "*" wildcard cover Authorization.
+                allow_headers = request_headers.get(b"access-control-request-headers", b"*")
+                headers = [*_PREFLIGHT_HEADERS, (b"access-control-allow-headers", allow_headers)]
+                await send({"type": "http.response.start", "status": 204, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_CORS_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
 def main() -> None:
     """Run the development server for the todo example."""
     app = mcp.streamable_http_app()
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
     app.mount(path=ship.assets_path, app=ship.assets)
-    uvicorn.run(app, port=3001)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+    uvicorn.run(FastCORS(app), port=3001, access_log=False)
 
 
 if __name__ == "__main__":
@@ -36,9 +36,15 @@ def test_add_todo_adds_item():
     assert todos[0].id
 
 
-def test_add_todo_rejects_empty_title():
+@pytest.mark.parametrize("title", ["", "   ", "\t\n"])
+def test_add_todo_rejects_empty_title(title: str):
     with pytest.raises(ValueError, match=r"Title cannot be empty\."):
-        todo_main.add_todo("   ")
+        todo_main.add_todo(title)
+
+
+def test_add_todo_strips_title():
+    todos = todo_main.add_todo("  Buy milk  ")
+    assert todos[0].title == "Buy milk"
 
 
 def test_toggle_todo_flips_completed_state():
@@ -94,3 +100,51 @@ async def test_mcp_list_tools_schemas_and_structured_calls(monkeypatch: pytest.M
 
         structured = _structured_from_call_result(await todo_main.mcp.call_tool("delete-todo", {"todo_id": todo_id}))
         assert structured == {"result": []}
+
+
+async def _call_fast_cors(scope: dict[str, Any]) -> tuple[list[str], list[dict[str, Any]]]:
+    calls: list[str] = []
+    sent: list[dict[str, Any]] = []
+
+    async def app(scope, _receive, send):
+        calls.append(scope["method"])
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await todo_main.FastCORS(app)(scope, receive, send)
+    return calls, sent
+
+
+@pytest.mark.parametrize(
+    ("request_headers", "allow_headers"),
+    [
+        ([(b"access-control-request-headers", b"authorization, content-type")], b"authorization, content-type"),
+        ([], b"*"),
+    ],
+)
+async def test_fast_cors_answers_preflight_with_requested_headers(
+    request_headers: list[tuple[bytes, bytes]],
+    allow_headers: bytes,
+):
+    headers = [(b"access-control-request-method", b"POST"), *request_headers]
+    calls, sent = await _call_fast_cors({"type": "http", "method": "OPTIONS", "headers": headers})
+
+    assert calls == []
+    assert sent[0]["status"] == 204
+    assert (b"access-control-allow-origin", b"*") in sent[0]["headers"]
+    assert (b"access-control-allow-headers", allow_headers) in sent[0]["headers"]
+    assert (b"access-control-max-age", b"600") in sent[0]["headers"]
+
+
+async def test_fast_cors_appends_headers_to_app_responses():
+    calls, sent = await _call_fast_cors({"type": "http", "method": "GET", "headers": []})
+
+    assert calls == ["GET"]
+    assert sent[0]["headers"][0] == (b"content-type", b"text/plain")
+    assert (b"access-control-allow-origin", b"*") in sent[0]["headers"]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 import pytest
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+_LAYOUT_SOURCE: Final[bytes] = b"export default function Layout({ children }) { return children; }\n"
+_PAGE_SOURCE: Final[bytes] = b"export default function Page() { return null; }\n"
+
 
 class FakeProcess:
     returncode: int | None = None
@@ -47,13 +50,9 @@ class SessionStateMiddleware:
         await self.app(scope, receive, send)
 
 
-@pytest.fixture
-def views_path(tmp_path: Path) -> Path:
-    views = tmp_path / "views"
-    (views / "widgets" / "hello").mkdir(parents=True)
-    (views / "widgets" / "hello" / "widget.tsx").write_text("export default function App() { return null; }\n")
-    (views / "dist").mkdir(parents=True, exist_ok=True)
-    return views
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(json.dumps(data).encode())
 
 
 def write_manifest(views: Path, *, assets_dir: str = "dist", manifest_out_dir: str | None = None) -> None:
@@ -70,17 +69,15 @@ def write_manifest(views: Path, *, assets_dir: str = "dist", manifest_out_dir: s
         },
     }
 
-    path = views / assets_dir / "gdansk-manifest.json"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(manifest), encoding="utf-8")
+    _write_json(views / assets_dir / "gdansk-manifest.json", manifest)
 
 
 @pytest.fixture
 def page_views_path(tmp_path: Path) -> Path:
     views = tmp_path / "views"
     (views / "app").mkdir(parents=True)
-    (views / "app" / "layout.tsx").write_text("export default function Layout({ children }) { return children; }\n")
-    (views / "app" / "page.tsx").write_text("export default function Page() { return null; }\n")
+    (views / "app" / "layout.tsx").write_bytes(_LAYOUT_SOURCE)
+    (views / "app" / "page.tsx").write_bytes(_PAGE_SOURCE)
     (views / "dist").mkdir(parents=True, exist_ok=True)
     return views
 
@@ -105,6 +102,4 @@ def write_page_manifest(
         **(imports or {}),
     }
 
-    path = views / assets_dir / "manifest.json"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(manifest), encoding="utf-8")
+    _write_json(views / assets_dir / "manifest.json", manifest)
@@ -37,6 +37,19 @@ def _register_hello_widget(ship: Ship) -> None:
         return None
 
 
+async def _ready_immediately(_client: httpx.AsyncClient) -> None:
+    return None
+
+
+async def _fail_ready(_client: httpx.AsyncClient) -> None:
+    msg = "boom"
+    raise RuntimeError(msg)
+
+
+async def _skip_sleep(_: float) -> None:
+    return None
+
+
 def test_ship_defaults_to_vite_under_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     views = tmp_path / "views"
     (views / "dist").mkdir(parents=True)
@@ -51,16 +64,11 @@ def test_ship_defaults_to_vite_under_cwd(tmp_path: Path, monkeypatch: pytest.Mon
     assert Path(str(ship.assets.directory)) == views / "dist"
 
 
-def test_ship_assets_can_be_mounted_before_build_output_exists(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def test_ship_assets_can_be_mounted_before_build_output_exists(tmp_path: Path):
     views = tmp_path / "views"
-    (views / "widgets" / "hello").mkdir(parents=True)
-    (views / "widgets" / "hello" / "widget.tsx").write_text(
-        "export default function App() { return null; }\n",
-        encoding="utf-8",
-    )
-    monkeypatch.chdir(tmp_path)
+    views.mkdir()
 
-    ship = Ship()
+    ship = Ship(vite=Vite(views))
     app = Starlette()
     app.mount(path=ship.assets_path, app=ship.assets)
 
@@ -68,11 +76,19 @@ def test_ship_assets_can_be_mounted_before_build_output_exists(tmp_path: Path, m
     assert Path(str(ship.assets.directory)) == views / "dist"
 
 
-def test_widget_rejects_missing_widget_file(views_path: Path):
+@pytest.mark.parametrize(
+    ("path", "error", "match"),
+    [
+        ("missing/widget.tsx", FileNotFoundError, "is not a file"),
+        ("../hello/widget.tsx", ValueError, "traversal segments"),
+        ("hello/app.tsx", ValueError, "widget.tsx or widget.jsx"),
+    ],
+)
+def test_widget_rejects_invalid_widget_path(views_path: Path, path: str, error: type[Exception], match: str):
     ship = Ship(vite=Vite(views_path))
 
-    with pytest.raises(FileNotFoundError, match="is not a file"):
-        ship.widget(path=Path("missing/widget.tsx"))
+    with pytest.raises(error, match=match):
+        ship.widget(path=Path(path))
 
 
 def test_ship_uses_default_runtime_host_and_port(views_path: Path):
@@ -347,9 +363,22 @@ async def test_widget_resource_renders_complete_document(views_path: Path):
     assert '<script type="module" src="http://render.test/@gdansk/client/hello.tsx"></script>' in html
 
 
-async def test_widget_resource_renders_production_scripts(views_path: Path):
-    write_manifest(views_path)
-    ship = Ship(vite=Vite(views_path))
+@pytest.mark.parametrize(
+    ("build_directory", "base_url", "prefix"),
+    [
+        ("dist", None, "/dist"),
+        ("public", None, "/public"),
+        ("dist", "https://example.com/app", "https://example.com/app/dist"),
+    ],
+)
+async def test_widget_resource_renders_production_scripts(
+    views_path: Path,
+    build_directory: str,
+    base_url: str | None,
+    prefix: str,
+):
+    write_manifest(views_path, assets_dir=build_directory)
+    ship = Ship(vite=Vite(views_path, build_directory=build_directory), base_url=base_url)
 
     @ship.widget(path=Path("hello/widget.tsx"), name="hello")
     def hello() -> None:
@@ -363,45 +392,11 @@ async def test_widget_resource_renders_production_scripts(views_path: Path):
     assert "@react-refresh" not in html
     assert "__vite_plugin_react_preamble_installed__" not in html
     assert '<div id="root"></div>' in html
-    assert '<link rel="stylesheet" href="/dist/hello/client.css">' in html
-    assert '<script type="module" src="/dist/hello/client.js"></script>' in html
+    assert f'<link rel="stylesheet" href="{prefix}/hello/client.css">' in html
+    assert f'<script type="module" src="{prefix}/hello/client.js"></script>' in html
     assert "/@vite/client" not in html
 
 
-async def test_widget_resource_uses_custom_assets_dir_for_production_scripts(views_path: Path):
-    write_manifest(views_path, assets_dir="public")
-    ship = Ship(vite=Vite(views_path, build_directory="public"))
-
-    @ship.widget(path=Path("hello/widget.tsx"), name="hello")
-    def hello() -> None:
-        return None
-
-    ship._vite.load_manifest()
-
-    html = await ship._widget_manager[Path("hello/widget.tsx")].resource.read()
-    assert isinstance(html, str)
-
-    assert '<link rel="stylesheet" href="/public/hello/client.css">' in html
-    assert '<script type="module" src="/public/hello/client.js"></script>' in html
-
-
-async def test_widget_resource_uses_base_url_for_production_assets(views_path: Path):
-    write_manifest(views_path)
-    ship = Ship(vite=Vite(views_path), base_url="https://example.com/app")
-
-    @ship.widget(path=Path("hello/widget.tsx"), name="hello")
-    def hello() -> None:
-        return None
-
-    ship._vite.load_manifest()
-
-    html = await ship._widget_manager[Path("hello/widget.tsx")].resource.read()
-    assert isinstance(html, str)
-
-    assert '<link rel="stylesheet" href="https://example.com/app/dist/hello/client.css">' in html
-    assert '<script type="module" src="https://example.com/app/dist/hello/client.js"></script>' in html
-
-
 async def test_widget_resource_raises_when_manifest_is_missing_widget(views_path: Path):
     ship = Ship(vite=Vite(views_path))
 
@@ -459,9 +454,6 @@ async def test_wait_for_vite_timeout_mentions_matching_vite_and_plugin_config(
 
     transport = httpx.MockTransport(handler)
 
-    async def fake_sleep(_: float) -> None:
-        return None
-
     async with httpx.AsyncClient(transport=transport) as client:
         ship = Ship(
             vite=Vite(views_path, host="localhost", port=43123),
@@ -469,7 +461,7 @@ async def test_wait_for_vite_timeout_mentions_matching_vite_and_plugin_config(
         )
         ship._vite._frontend = cast("Any", FakeProcess())
         ship._vite._origin = "http://localhost:43123"
-        monkeypatch.setattr("gdansk.vite.sleep", fake_sleep)
+        monkeypatch.setattr("gdansk.vite.sleep", _skip_sleep)
 
         with pytest.raises(RuntimeError) as exc_info:
             await ship._vite.wait_until_ready(client)
@@ -486,11 +478,8 @@ async def test_ship_mcp_cleans_up_runtime_on_exit(views_path: Path, monkeypatch:
     async def fake_create_subprocess_exec(*_args: str, **_kwargs: object) -> FakeManagedProcess:
         return process
 
-    async def fake_wait_until_ready(_client: httpx.AsyncClient) -> None:
-        return None
-
     monkeypatch.setattr("gdansk.vite.create_subprocess_exec", fake_create_subprocess_exec)
-    monkeypatch.setattr(ship._vite, "wait_until_ready", fake_wait_until_ready)
+    monkeypatch.setattr(ship._vite, "wait_until_ready", _ready_immediately)
 
     async with ship.lifespan(mcp=_app(), watch=True):
         assert ship._active is True
@@ -516,12 +505,8 @@ async def test_ship_mcp_cleans_up_runtime_on_start_failure(views_path: Path, mon
     async def fake_create_subprocess_exec(*_args: str, **_kwargs: object) -> FakeManagedProcess:
         return process
 
-    async def fake_wait_until_ready(_client: httpx.AsyncClient) -> None:
-        msg = "boom"
-        raise RuntimeError(msg)
-
     monkeypatch.setattr("gdansk.vite.create_subprocess_exec", fake_create_subprocess_exec)
-    monkeypatch.setattr(ship._vite, "wait_until_ready", fake_wait_until_ready)
+    monkeypatch.setattr(ship._vite, "wait_until_ready", _fail_ready)
 
     with pytest.raises(RuntimeError, match="boom"):
         async with ship.lifespan(mcp=_app(), watch=True):
@@ -565,18 +550,11 @@ async def test_ship_mcp_preserves_startup_error_when_runtime_exits_during_cleanu
     async def fake_create_subprocess_exec(*_args: str, **_kwargs: object) -> VanishedProcess:
         return process
 
-    async def fake_sleep(_: float) -> None:
-        return None
-
-    async def fake_wait_until_ready(_client: httpx.AsyncClient) -> None:
-        msg = "boom"
-        raise RuntimeError(msg)
-
     process = VanishedProcess()
     ship = Ship(vite=Vite(views_path))
     monkeypatch.setattr("gdansk.vite.create_subprocess_exec", fake_create_subprocess_exec)
-    monkeypatch.setattr("gdansk.vite.sleep", fake_sleep)
-    monkeypatch.setattr(ship._vite, "wait_until_ready", fake_wait_until_ready)
+    monkeypatch.setattr("gdansk.vite.sleep", _skip_sleep)
+    monkeypatch.setattr(ship._vite, "wait_until_ready", _fail_ready)
 
     with pytest.raises(RuntimeError, match="boom"):
         async with ship.lifespan(mcp=_app(), watch=True):
@@ -600,12 +578,9 @@ async def test_start_dev_uses_runtime_port(views_path: Path, monkeypatch: pytest
         captured_args = args
         return FakeManagedProcess()
 
-    async def fake_wait_until_ready(_client: httpx.AsyncClient) -> None:
-        return None
-
     ship = Ship(vite=Vite(views_path, port=43123))
     monkeypatch.setattr("gdansk.vite.create_subprocess_exec", fake_create_subprocess_exec)
-    monkeypatch.setattr(ship._vite, "wait_until_ready", fake_wait_until_ready)
+    monkeypatch.setattr(ship._vite, "wait_until_ready", _ready_immediately)
 
     async with ship.lifespan(mcp=_app(), watch=True):
         pass
@@ -642,7 +617,12 @@ async def test_start_production_builds_and_loads_manifest(views_path: Path, monk
     assert ship._vite._manifest is None
 
 
-async def test_start_production_requires_manifest(views_path: Path, monkeypatch: pytest.MonkeyPatch):
+@pytest.mark.parametrize("watch", [False, None])
+async def test_start_without_dev_server_requires_manifest(
+    views_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    watch: bool | None,  # noqa: FBT001
+):
     ship = Ship(vite=Vite(views_path))
     _register_hello_widget(ship)
 
@@ -652,7 +632,7 @@ async def test_start_production_requires_manifest(views_path: Path, monkeypatch:
     monkeypatch.setattr(ship._vite, "build", fake_build)
 
     with pytest.raises(RuntimeError, match="did not produce a manifest"):
-        async with ship.lifespan(mcp=_app(), watch=False):
+        async with ship.lifespan(mcp=_app(), watch=watch):
             pytest.fail("manifest load should fail before yield")
 
 
@@ -664,34 +644,10 @@ async def test_start_prebuilt_loads_manifest_without_build(views_path: Path, mon
     async def fail_build() -> None:
         pytest.fail("build should not run when watch is None")
 
-    monkeypatch.setattr(ship._vite, "build", fail_build)
-
-    async with ship.lifespan(mcp=_app(), watch=None):
-        assert ship._vite._frontend is None
-        assert ship._vite.require_manifest().widgets["hello"].client == "dist/hello/client.js"
-        assert ship._vite._origin is None
-        assert ship._dev is False
-
-    assert ship._vite._manifest is None
-
-
-async def test_start_prebuilt_requires_manifest(views_path: Path):
-    ship = Ship(vite=Vite(views_path))
-    _register_hello_widget(ship)
-
-    with pytest.raises(RuntimeError, match="did not produce a manifest"):
-        async with ship.lifespan(mcp=_app(), watch=None):
-            pytest.fail("manifest load should fail before yield")
-
-
-async def test_ship_mcp_open_prebuilt_skips_subprocess(views_path: Path, monkeypatch: pytest.MonkeyPatch):
-    write_manifest(views_path)
-    ship = Ship(vite=Vite(views_path))
-    _register_hello_widget(ship)
-
     async def fail_create_subprocess_exec(*_args: str, **_kwargs: object) -> FakeManagedProcess:
         pytest.fail("create_subprocess_exec should not run when watch is None")
 
+    monkeypatch.setattr(ship._vite, "build", fail_build)
     monkeypatch.setattr("gdansk.vite.create_subprocess_exec", fail_create_subprocess_exec)
 
     async with ship.lifespan(mcp=_app(), watch=None):
@@ -705,36 +661,6 @@ async def test_ship_mcp_open_prebuilt_skips_subprocess(views_path: Path, monkeyp
     assert ship._vite._manifest is None
 
 
-async def test_ship_mcp_registers_widget_tool_and_resource(
-    views_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-):
-    ship = Ship(vite=Vite(views_path))
-    app = _app()
-
-    @ship.widget(path=Path("hello/widget.tsx"), name="hello")
-    def hello() -> None:
-        return None
-
-    async def fake_prepare_frontend(*, watch: bool | None) -> None:
-        assert watch is None
-
-    monkeypatch.setattr(ship, "_prepare_frontend", fake_prepare_frontend)
-
-    async with ship.lifespan(mcp=app, watch=None):
-        resources = await app.list_resources()
-        resource = next((item for item in resources if item.uri == "ui://hello"), None)
-        assert resource is not None
-        assert resource.name == "hello"
-        assert resource.mime_type == "text/html;profile=mcp-app"
-
-        tools = await app.list_tools()
-        tool = next((item for item in tools if item.name == "hello"), None)
-        assert tool is not None
-        assert tool.meta is not None
-        assert tool.meta["ui"]["resourceUri"] == "ui://hello"
-
-
 def test_load_manifest_requires_matching_build_directory(views_path: Path):
     write_manifest(views_path, assets_dir="public", manifest_out_dir="dist")
     ship = Ship(vite=Vite(views_path, build_directory="public"))
@@ -296,9 +296,8 @@ def test_fastapi_inertia_page_decorator_renders_model_props(page_views_path: Pat
         html = client.get("/", follow_redirects=False)
         initial = client.get("/", headers={"X-Inertia": "true"}, follow_redirects=False)
 
-    assert activity_calls == []
+        assert activity_calls == []
 
-    with TestClient(app) as client:
         partial = client.get(
             "/",
             headers={
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import cast
+
+from gdansk.metadata import Metadata, merge_metadata
+
+
+def _frozen(metadata: Metadata) -> Metadata:
+    return cast("Metadata", MappingProxyType(metadata))
+
+
+def test_merge_metadata_overrides_top_level_keys_shallowly() -> None:
+    base = _frozen({"title": {"default": "Base", "template": "%s | Base"}, "description": "Base description"})
+    override = _frozen({"title": {"absolute": "Override"}})
+
+    assert merge_metadata(base, override) == {
+        "description": "Base description",
+        "title": {"absolute": "Override"},
+    }
+
+
+def test_merge_metadata_copies_a_single_side() -> None:
+    metadata = _frozen({"title": "Only"})
+
+    for merged in (merge_metadata(metadata, None), merge_metadata(None, metadata)):
+        assert merged == {"title": "Only"}
+        assert isinstance(merged, dict)
+
+
+def test_merge_metadata_returns_none_without_inputs() -> None:
+    assert merge_metadata(None, None) is None
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
+import httpx
 import pytest
 
-from gdansk.vite import Vite
+from gdansk.__tests__.unit.conftest import FakeManagedProcess, FakeProcess
+from gdansk.vite import Vite, _find_deno_bin
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -20,6 +22,14 @@ def test_vite_rejects_missing_root(tmp_path: Path):
         Vite(tmp_path / "missing")
 
 
+def test_vite_rejects_file_root(tmp_path: Path):
+    root = tmp_path / "views"
+    root.touch()
+
+    with pytest.raises(ValueError, match="not a directory"):
+        Vite(root)
+
+
 def test_vite_rejects_invalid_build_directory(views_path: Path):
     with pytest.raises(ValueError, match="build directory"):
         Vite(views_path, build_directory="../public")
@@ -55,3 +65,80 @@ def test_vite_defaults_to_views_under_cwd(tmp_path: Path, monkeypatch: pytest.Mo
     assert vite.build_directory == "dist"
     assert vite.build_directory_path == views / "dist"
     assert vite.widgets_root == views / "widgets"
+
+
+def test_vite_resolves_deno_binary_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    calls: list[None] = []
+
+    def find_deno_bin() -> str:
+        calls.append(None)
+        return "deno"
+
+    monkeypatch.setattr("gdansk.vite.find_deno_bin", find_deno_bin)
+    _find_deno_bin.cache_clear()
+    try:
+        Vite(first)
+        Vite(second)
+    finally:
+        _find_deno_bin.cache_clear()
+
+    assert len(calls) == 1
+
+
+async def test_vite_stop_backs_off_before_killing(views_path: Path, monkeypatch: pytest.MonkeyPatch):
+    class StubbornProcess(FakeManagedProcess):
+        def terminate(self) -> None:
+            self.terminated = True
+
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    process = StubbornProcess()
+    vite = Vite(views_path)
+    vite._frontend = cast("Any", process)
+    monkeypatch.setattr("gdansk.vite.sleep", fake_sleep)
+
+    await vite.stop()
+
+    assert delays[0] == pytest.approx(0.001)
+    assert delays == sorted(delays)
+    assert max(delays) == pytest.approx(0.05)
+    assert sum(delays) >= 1
+    assert process.terminated is True
+    assert process.killed is True
+    assert process.waited is True
+    assert vite.has_runtime() is False
+
+
+async def test_vite_wait_until_ready_backs_off_between_polls(views_path: Path, monkeypatch: pytest.MonkeyPatch):
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            msg = "connection failed"
+            raise httpx.RequestError(msg, request=request)
+        return httpx.Response(200)
+
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    vite = Vite(views_path)
+    vite._frontend = cast("Any", FakeProcess())
+    vite._origin = "http://127.0.0.1:13714"
+    monkeypatch.setattr("gdansk.vite.sleep", fake_sleep)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await vite.wait_until_ready(client)
+
+    assert attempts == 3
+    assert delays == pytest.approx([0.001, 0.002])
@@ -1,4 +1,6 @@
-from gdansk.widget import WidgetExtra, WidgetMeta, transform
+import pytest
+
+from gdansk.widget import WidgetCSPMeta, WidgetExtra, WidgetMeta, transform
 
 
 def test_transform_prefers_border_false_is_emitted():
@@ -31,40 +33,38 @@ def test_transform_maps_all_csp_fields():
     assert csp["frameDomains"] == ["https://embed.example.com"]
 
 
-def test_transform_appends_base_url_to_resource_domains():
-    widget: WidgetMeta = {
-        "ui": {
-            "csp": {
-                "resource_domains": ["https://cdn.example.com"],
-            },
-        },
-    }
+@pytest.mark.parametrize(
+    ("csp", "expected"),
+    [
+        (
+            {"connect_domains": ["https://api.example.com"]},
+            {"connectDomains": ["https://api.example.com", "https://example.com"]},
+        ),
+        (
+            {"connect_domains": ["https://api.example.com", "https://example.com"]},
+            {"connectDomains": ["https://api.example.com", "https://example.com"]},
+        ),
+        (
+            {"resource_domains": ["https://cdn.example.com"]},
+            {"resourceDomains": ["https://cdn.example.com", "https://example.com"]},
+        ),
+        (
+            {"resource_domains": ["https://cdn.example.com", "https://example.com"]},
+            {"resourceDomains": ["https://cdn.example.com", "https://example.com"]},
+        ),
+    ],
+)
+def test_transform_adds_base_url_origin_to_csp_domains_once(csp: WidgetCSPMeta, expected: dict[str, list[str]]):
+    widget: WidgetMeta = {"ui": {"csp": csp}}
     extra: WidgetExtra = {"uri": "ui://x", "base_url": "https://example.com/app", "description": None}
 
     _tool, resource = transform(widget, extra)
 
-    assert resource["ui"]["csp"]["resourceDomains"] == [
-        "https://cdn.example.com",
-        "https://example.com",
-    ]
-
-
-def test_transform_appends_base_url_to_connect_domains():
-    widget: WidgetMeta = {
-        "ui": {
-            "csp": {
-                "connect_domains": ["https://api.example.com"],
-            },
-        },
+    assert resource["ui"]["csp"] == {
+        "connectDomains": ["https://example.com"],
+        "resourceDomains": ["https://example.com"],
+        **expected,
     }
-    extra: WidgetExtra = {"uri": "ui://x", "base_url": "https://example.com/app", "description": None}
-
-    _tool, resource = transform(widget, extra)
-
-    assert resource["ui"]["csp"]["connectDomains"] == [
-        "https://api.example.com",
-        "https://example.com",
-    ]
 
 
 def test_transform_synthesizes_csp_from_base_url_without_domain():
@@ -77,39 +77,3 @@ def test_transform_synthesizes_csp_from_base_url_without_domain():
     assert resource["ui"]["csp"]["resourceDomains"] == ["https://example.com"]
     assert "domain" not in resource["ui"]
     assert "openai/widgetDomain" not in resource
-
-
-def test_transform_does_not_duplicate_base_url_in_connect_domains():
-    widget: WidgetMeta = {
-        "ui": {
-            "csp": {
-                "connect_domains": ["https://api.example.com", "https://example.com"],
-            },
-        },
-    }
-    extra: WidgetExtra = {"uri": "ui://x", "base_url": "https://example.com/app", "description": None}
-
-    _tool, resource = transform(widget, extra)
-
-    assert resource["ui"]["csp"]["connectDomains"] == [
-        "https://api.example.com",
-        "https://example.com",
-    ]
-
-
-def test_transform_does_not_duplicate_base_url_in_resource_domains():
-    widget: WidgetMeta = {
-        "ui": {
-            "csp": {
-                "resource_domains": ["https://cdn.example.com", "https://example.com"],
-            },
-        },
-    }
-    extra: WidgetExtra = {"uri": "ui://x", "base_url": "https://example.com/app", "description": None}
-
-    _tool, resource = transform(widget, extra)
-
-    assert resource["ui"]["csp"]["resourceDomains"] == [
-        "https://cdn.example.com",
-        "https://example.com",
-    ]
@@ -186,7 +186,12 @@ class Ship:
 
         self._active = True
         self._dev = False
+        self._clear_manifests()
+
+    def _clear_manifests(self) -> None:
         self._vite.clear_manifest()
+        if self._inertia_app is not None:
+            self._inertia_app.clear_manifest()
 
     async def _run_frontend(self, *, watch: bool | None) -> None:
         match watch:
@@ -207,7 +212,7 @@ class Ship:
     async def _prepare_inertia(self, *, watch: bool | None) -> None:
         await self._run_frontend(watch=watch)
         if not self._dev:
-            self._ensure_inertia_app()._resolve_assets()  # noqa: SLF001
+            self._ensure_inertia_app().load_manifest()
 
     def asset_url(self, path: str) -> str:
         return self._asset_url(path)
@@ -239,7 +244,7 @@ class Ship:
         try:
             await self._vite.stop()
         finally:
-            self._vite.clear_manifest()
+            self._clear_manifests()
             self._dev = False
             self._active = False
             if self._session_client is not None:
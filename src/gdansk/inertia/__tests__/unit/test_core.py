@@ -11,6 +11,7 @@ from gdansk import Metadata, Ship, Vite
 from gdansk.__tests__.unit.conftest import write_page_manifest
 from gdansk.inertia import InertiaPage, InertiaResponse  # noqa: TC001
 from gdansk.inertia.__tests__.unit import helpers
+from gdansk.inertia.core import InertiaApp, ViteManifestEntry
 
 
 def test_inertia_renders_production_html_shell(page_views_path: Path):
@@ -72,7 +73,7 @@ def test_inertia_renders_dev_html_shell(page_views_path: Path):
 
 def test_inertia_runtime_dependency_targets_released_v3() -> None:
     package_json_path = Path(__file__).resolve().parents[5] / "packages/vite/package.json"
-    package_json = loads(package_json_path.read_text(encoding="utf-8"))
+    package_json = loads(package_json_path.read_bytes())
 
     assert package_json["dependencies"]["@inertiajs/react"] == "3.0.3"
 
@@ -226,3 +227,36 @@ def test_inertia_rejects_invalid_component_keys(page_views_path: Path):
 
     with pytest.raises(ValueError, match="component"):
         ship.page("../secret")
+
+
+def test_inertia_rereads_manifest_only_after_rebuild(page_views_path: Path, monkeypatch: pytest.MonkeyPatch):
+    write_page_manifest(page_views_path)
+    ship = Ship(vite=Vite(page_views_path))
+    app = helpers._page_app(ship)
+    parsed: list[bytes] = []
+    parse = InertiaApp._parse_client_manifest
+
+    def counting_parse(self: InertiaApp, source: bytes) -> dict[str, ViteManifestEntry]:
+        parsed.append(source)
+        return parse(self, source)
+
+    monkeypatch.setattr(InertiaApp, "_parse_client_manifest", counting_parse)
+
+    @app.get("/")
+    @ship.page("/")
+    async def home() -> helpers.EmptyPageProps:
+        return helpers.EmptyPageProps()
+
+    with TestClient(app) as client:
+        version = client.get("/", headers={"X-Inertia": "true"}).json()["version"]
+        assert client.get("/", headers={"X-Inertia": "true", "X-Inertia-Version": version}).status_code == 200
+        assert len(parsed) == 1
+
+        write_page_manifest(page_views_path, file="assets/rebuilt.js")
+        stale = client.get("/", headers={"X-Inertia": "true", "X-Inertia-Version": version})
+        response = client.get("/")
+
+    assert stale.status_code == 409
+    assert response.status_code == 200
+    assert '<script type="module" src="/dist/assets/rebuilt.js"></script>' in response.text
+    assert len(parsed) == 2
@@ -45,6 +45,13 @@ class PageAssets:
     script: str
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class ClientManifest:
+    assets: PageAssets
+    stat: tuple[int, int, int]
+    version: str
+
+
 class InertiaApp:
     def __init__(
         self,
@@ -57,6 +64,8 @@ class InertiaApp:
         self._ship: Final[Ship] = ship
         self._version_override: Final[str | None] = config.version
 
+        self._manifest: ClientManifest | None = None
+
     @property
     def root_id(self) -> str:
         return self._root_id
@@ -167,12 +176,7 @@ class InertiaApp:
         if self._ship.dev:
             return None
 
-        path = self._ship.client_manifest_path
-        if not path.is_file():
-            msg = f"The frontend build did not produce a manifest at {path}"
-            raise RuntimeError(msg)
-
-        return sha256(path.read_bytes()).hexdigest()[:12]
+        return self.load_manifest().version
 
     def render_html(self, *, metadata: Metadata | None, page: dict[str, Any]) -> str:
         assets = self._resolve_assets()
@@ -207,10 +211,35 @@ class InertiaApp:
             runtime_origin = self._ship.require_vite_origin()
             return PageAssets(css=[], script=join_url(runtime_origin, _PAGE_DEV_ENTRY))
 
-        manifest = self._load_client_manifest()
+        return self.load_manifest().assets
+
+    def clear_manifest(self) -> None:
+        self._manifest = None
+
+    def load_manifest(self) -> ClientManifest:
+        path = self._ship.client_manifest_path
+        cached = self._manifest
+        try:
+            stat = path.stat()
+            manifest_stat = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if cached is not None and cached.stat == manifest_stat:
+                return cached
+
+            source = path.read_bytes()
+        except OSError as exc:
+            msg = f"The frontend build did not produce a manifest at {path}"
+            raise RuntimeError(msg) from exc
+
+        manifest = self._parse_client_manifest(source)
         entry = self._resolve_manifest_entry(manifest)
         css = [self._ship.asset_url(href) for href in self._collect_css(manifest, entry)]
-        return PageAssets(css=css, script=self._ship.asset_url(entry["file"]))
+        loaded = ClientManifest(
+            assets=PageAssets(css=css, script=self._ship.asset_url(entry["file"])),
+            stat=manifest_stat,
+            version=sha256(source).hexdigest()[:12],
+        )
+        self._manifest = loaded
+        return loaded
 
     def _collect_css(
         self,
@@ -242,14 +271,10 @@ class InertiaApp:
         visit(entry)
         return css
 
-    def _load_client_manifest(self) -> dict[str, ViteManifestEntry]:
+    def _parse_client_manifest(self, source: bytes) -> dict[str, ViteManifestEntry]:
         path = self._ship.client_manifest_path
-        if not path.is_file():
-            msg = f"The frontend build did not produce a manifest at {path}"
-            raise RuntimeError(msg)
-
         try:
-            manifest = loads(path.read_text(encoding="utf-8"))
+            manifest = loads(source)
         except JSONDecodeError as exc:
             msg = f"The frontend build produced an invalid manifest at {path}"
             raise RuntimeError(msg) from exc
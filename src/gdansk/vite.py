@@ -3,10 +3,11 @@ from __future__ import annotations
 from asyncio import sleep
 from asyncio.subprocess import DEVNULL, PIPE, Process, create_subprocess_exec
 from contextlib import suppress
+from functools import cache
 from http import HTTPStatus
 from os import PathLike
 from pathlib import Path, PurePosixPath
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from deno import find_deno_bin
 from httpx import AsyncClient, RequestError
@@ -15,9 +16,25 @@ from pydantic import ValidationError
 from gdansk.manifest import GdanskManifest, WidgetManifest
 from gdansk.utils import join_url
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 type PathType = str | PathLike[str]
 
 
+@cache
+def _find_deno_bin() -> str:
+    return find_deno_bin()
+
+
+def _backoff(budget: float) -> Iterator[float]:
+    delay, waited = 0.001, 0.0
+    while waited < budget:
+        yield delay
+        waited += delay
+        delay = min(delay * 2, 0.05)
+
+
 class Vite:
     def __init__(
         self,
@@ -30,11 +47,11 @@ class Vite:
         if root is None:
             root = Path.cwd() / "views"
 
-        if not (root := Path(root)).exists():
-            msg = f"The frontend root directory (i.e. {root}) does not exist"
-            raise FileNotFoundError(msg)
+        if not (root := Path(root)).is_dir():
+            if not root.exists():
+                msg = f"The frontend root directory (i.e. {root}) does not exist"
+                raise FileNotFoundError(msg)
 
-        if not root.is_dir():
             msg = f"The frontend root directory (i.e. {root}) is not a directory"
             raise ValueError(msg)
 
@@ -50,11 +67,12 @@ class Vite:
             build_directory,
             name="build",
         )
-        self._build_directory_path: Final[Path] = root.absolute().resolve() / self._build_directory
-        self._deno: Final[str] = find_deno_bin()
+        root = root.resolve()
+        self._build_directory_path: Final[Path] = root / self._build_directory
+        self._deno: Final[str] = _find_deno_bin()
         self._host: Final[str] = host
         self._port: Final[int] = port
-        self._root: Final[Path] = root.absolute().resolve()
+        self._root: Final[Path] = root
         self._widgets_root: Final[Path] = self._root / "widgets"
 
         self._frontend: Process | None = None
@@ -105,12 +123,14 @@ class Vite:
 
     def load_manifest(self) -> GdanskManifest:
         path = self.manifest_path
-        if not path.is_file():
+        try:
+            source = path.read_bytes()
+        except OSError as e:
             msg = f"The frontend build did not produce a manifest at {path}"
-            raise RuntimeError(msg)
+            raise RuntimeError(msg) from e
 
         try:
-            manifest = GdanskManifest.model_validate_json(path.read_text(encoding="utf-8"))
+            manifest = GdanskManifest.model_validate_json(source)
         except ValidationError as e:
             msg = f"The frontend build produced an invalid manifest at {path}"
             raise RuntimeError(msg) from e
@@ -221,10 +241,10 @@ class Vite:
             with suppress(ProcessLookupError):
                 frontend.terminate()
 
-            for _ in range(20):
+            for delay in _backoff(1):
                 if frontend.returncode is not None:
                     break
-                await sleep(0.05)
+                await sleep(delay)
 
             if frontend.returncode is None:
                 with suppress(ProcessLookupError):
@@ -238,7 +258,7 @@ class Vite:
 
         client_url = join_url(self._origin, "/@vite/client")
 
-        for _ in range(1200):
+        for delay in _backoff(60):
             if self._frontend.returncode is not None:
                 msg = (
                     "The frontend dev server exited before the Vite client became available "
@@ -254,7 +274,7 @@ class Vite:
                 if response.status_code == HTTPStatus.OK:
                     return
 
-            await sleep(0.05)
+            await sleep(delay)
 
         msg = (
             f"The frontend dev server did not start in time ({client_url}). "